@@ -2,7 +2,8 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 import math
 import time
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List
 from app.database import get_db
 from app.models import Stock
 from app.services.spike_service import get_top_movers as get_top_movers_service, get_recent_data
@@ -28,6 +29,14 @@ NEWS_SUMMARY_TTL = 12 * 60 * 60  # 12 hours in seconds
 _endpoint_cache: Dict[str, Any] = {}
 ENDPOINT_CACHE_TTL = 5 * 60  # 5 minutes
 
+# Runs each /analysis request's three slow signals (news, earnings, direction) concurrently.
+# Sized for _ANALYSIS_CONCURRENCY simultaneous analyses; beyond that, signals queue for a
+# worker and requests slow down toward the old serial path.
+_ANALYSIS_CONCURRENCY = 8
+_analysis_executor = ThreadPoolExecutor(max_workers=_ANALYSIS_CONCURRENCY * 3, thread_name_prefix="analysis")
+# Separate pool so /news-summary's RSS fetch never waits behind analysis tasks
+_news_summary_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="news-summary")
+
 
 def _cache_get(key: str) -> Any:
     """Return cached value if still valid, else None."""
@@ -45,6 +54,15 @@ def _cache_set(key: str, data: Any, ttl: int = ENDPOINT_CACHE_TTL) -> None:
 router = APIRouter(prefix="/api/stocks", tags=["stocks"])
 
 
+def _display_name(ticker: str) -> str:
+    """Company name for a ticker, falling back to the bare NSE symbol."""
+    return NIFTY100_NAMES.get(ticker, ticker.replace(".NS", ""))
+
+
+# Built once at import: the fallback stock list is static, so requests reuse it
+_NIFTY100_LISTING = [{"ticker": ticker, "name": _display_name(ticker)} for ticker in NIFTY100]
+
+
 def _safe_pct(value, default: float = 0.0) -> float:
     """Convert value to a finite float percentage, else return default."""
     try:
@@ -62,13 +80,7 @@ def list_stocks(db: Session = Depends(get_db)):
         return stocks
 
     # Fallback before DB seed is implemented
-    return [
-        {
-            "ticker": ticker,
-            "name": NIFTY100_NAMES.get(ticker, ticker.replace(".NS", "")),
-        }
-        for ticker in NIFTY100
-    ]
+    return _NIFTY100_LISTING
 
 
 @router.get("/top-movers")
@@ -80,19 +92,11 @@ def get_top_movers(
     """Get top gainers and losers for lookback period."""
     data = get_top_movers_service(NIFTY100, days=lookback_days, top_n=top_n)
     gainers = [
-        {
-            "ticker": ticker,
-            "name": NIFTY100_NAMES.get(ticker, ticker.replace(".NS", "")),
-            "change": change,
-        }
+        {"ticker": ticker, "name": _display_name(ticker), "change": change}
         for ticker, change in data.get("gainers", {}).items()
     ]
     losers = [
-        {
-            "ticker": ticker,
-            "name": NIFTY100_NAMES.get(ticker, ticker.replace(".NS", "")),
-            "change": change,
-        }
+        {"ticker": ticker, "name": _display_name(ticker), "change": change}
         for ticker, change in data.get("losers", {}).items()
     ]
 
@@ -120,6 +124,37 @@ def _confidence_label(score: int) -> str:
     else:
         return "Low"
 
+def _scored_news(ticker: str, lookback_days: int) -> List[Dict]:
+    """Fetch analysis headlines and attach FinBERT sentiment to each."""
+    news_items = fetch_news(
+        ticker,
+        max_headlines=10,
+        lookback_days=max(lookback_days, 3),
+        include_full_text=True,
+        max_scrapes=5,
+    )
+    analyzer = get_sentiment_analyzer()
+    sentiments = analyzer.analyse_sentiment_batch([article.get("title", "") for article in news_items])
+    for article, sentiment in zip(news_items, sentiments):
+        article["sentiment_label"] = sentiment["label"]
+        article["sentiment_score"] = sentiment["sentiment_score"]
+    return news_items
+
+
+def _earnings_signal(ticker: str, lookback_days: int) -> Dict:
+    """Earnings signal from yfinance, with the BSE filing headline as fallback."""
+    earnings_fired, earnings_data = check_earnings_release(ticker, lookback_days=lookback_days)
+    earnings_signal = {"fired": earnings_fired}
+    if earnings_data:
+        earnings_signal.update(earnings_data)
+
+    if not earnings_fired:
+        bse_filing = get_latest_earnings_filing(ticker, lookback_days=lookback_days)
+        if bse_filing:
+            earnings_signal["bse_headline"] = bse_filing.get("headline", "")
+    return earnings_signal
+
+
 @router.get("/{ticker}/analysis")
 def get_stock_analysis(
     ticker: str,
@@ -136,6 +171,15 @@ def get_stock_analysis(
     price_df = get_recent_data(ticker, period=period, interval="1d")
     if price_df is None or price_df.empty:
         return {"ticker": ticker, "error": "No price data found.", "price_change": 0.0}
+
+    # Start the slow independent signals now; they overlap with the price,
+    # technical and sector work below and are joined when building the result.
+    news_future = _analysis_executor.submit(_scored_news, ticker, lookback_days)
+    earnings_future = _analysis_executor.submit(_earnings_signal, ticker, lookback_days)
+    # predict_direction fetches with its own yf.Ticker outside spike_service's _yf_lock, as it
+    # did on the request thread; that lock only serialises get_recent_data's cached history fetch.
+    direction_future = _analysis_executor.submit(predict_direction, ticker)
+
     try:
         change_pct_raw = get_top_movers_service([ticker], days=lookback_days).get("movement", {}).get(ticker)
         change_pct = _safe_pct(change_pct_raw)
@@ -147,19 +191,9 @@ def get_stock_analysis(
     technical = calculate_technical_signals(price_df)
     technical_fired, technical_summary = check_technical_breakout(technical)
 
-    news_items = fetch_news(
-        ticker,
-        max_headlines=10,
-        lookback_days=max(lookback_days, 3),
-        include_full_text=True,
-        max_scrapes=5,
-    )
-    analyzer = get_sentiment_analyzer()
-    for article in news_items:
-        sentiment = analyzer.analyse_sentiment(article.get("title", ""))
-        article["sentiment_label"] = sentiment["label"]
-        article["sentiment_score"] = sentiment["sentiment_score"]
+    sector = compare_stock_to_sector(ticker, change_pct, lookback_days=lookback_days)
 
+    news_items = news_future.result()
     major_news = {"fired": False}
     if news_items:
         scored = sorted(news_items, key=lambda x: abs(float(x.get("sentiment_score", 0.0))), reverse=True)
@@ -172,17 +206,7 @@ def get_stock_analysis(
             "sentiment_score": best.get("sentiment_score", 0.0),
         }
 
-    earnings_fired, earnings_data = check_earnings_release(ticker, lookback_days=lookback_days)
-    earnings_signal = {"fired": earnings_fired}
-    if earnings_data:
-        earnings_signal.update(earnings_data)
-        
-    if not earnings_fired:
-        bse_filing = get_latest_earnings_filing(ticker, lookback_days=lookback_days)
-        if bse_filing:
-            earnings_signal["bse_headline"] = bse_filing.get("headline", "")
-
-    sector = compare_stock_to_sector(ticker, change_pct, lookback_days=lookback_days)
+    earnings_signal = earnings_future.result()
 
     signals = {
         "earnings_release": earnings_signal,
@@ -199,7 +223,7 @@ def get_stock_analysis(
     reason_category, confidence, reason_detail = _reason_engine.combine_signals(signals)
     summary = _reason_engine.generate_summary(ticker, change_pct, reason_category, reason_detail)
 
-    direction_pred = predict_direction(ticker)
+    direction_pred = direction_future.result()
 
     result = {
         "ticker": ticker,
@@ -233,18 +257,22 @@ def get_chart_data(
     if df is None or df.empty:
         return {"ticker": ticker, "data": [], "error": "No chart data found."}
 
-    data = []
-    for idx, row in df.iterrows():
-        data.append(
-            {
-                "date": idx.isoformat(),
-                "open": float(row["Open"]),
-                "high": float(row["High"]),
-                "low": float(row["Low"]),
-                "close": float(row["Close"]),
-                "volume": float(row["Volume"]),
-            }
+    # Column-wise conversion instead of iterrows: one float cast per column, not per cell.
+    # Prices are rounded to paise: adjusted closes carry float32 noise
+    # (e.g. 1523.4500732421875) that roughly doubles the payload for no visible gain.
+    ohlcv = df[["Open", "High", "Low", "Close", "Volume"]].astype(float)
+    ohlcv[["Open", "High", "Low", "Close"]] = ohlcv[["Open", "High", "Low", "Close"]].round(2)
+    data = [
+        {"date": idx.isoformat(), "open": o, "high": h, "low": l, "close": c, "volume": v}
+        for idx, o, h, l, c, v in zip(
+            ohlcv.index,
+            ohlcv["Open"].tolist(),
+            ohlcv["High"].tolist(),
+            ohlcv["Low"].tolist(),
+            ohlcv["Close"].tolist(),
+            ohlcv["Volume"].tolist(),
         )
+    ]
     change_pct_raw = get_top_movers_service([ticker], days=lookback_days).get("movement", {}).get(ticker)
     change_pct = _safe_pct(change_pct_raw)
 
@@ -314,8 +342,8 @@ def get_stock_news(
             pass
 
     analyzer = get_sentiment_analyzer()
-    for article in news:
-        sentiment = analyzer.analyse_sentiment(article.get("title", ""))
+    sentiments = analyzer.analyse_sentiment_batch([article.get("title", "") for article in news])
+    for article, sentiment in zip(news, sentiments):
         article["sentiment_label"] = sentiment["label"]
         article["sentiment_score"] = sentiment["sentiment_score"]
 
@@ -404,10 +432,12 @@ def get_news_summary(
     if cached and time.time() < cached["expires_at"]:
         return cached["data"]
 
-    stock_name = NIFTY100_NAMES.get(ticker, ticker.replace(".NS", ""))
+    stock_name = _display_name(ticker)
 
-    # ── Top 5 headlines from RSS (fast, unchanged) ────────────────────────
-    top_news = fetch_news(
+    # ── Top 5 headlines from RSS, fetched alongside NewsData.io ───────────
+    # The two sources are independent, so the RSS round-trips overlap with the API call.
+    top_news_future = _news_summary_executor.submit(
+        fetch_news,
         ticker,
         max_headlines=5,
         lookback_days=3,
@@ -422,6 +452,7 @@ def get_news_summary(
         api_key=api_key,
         max_articles=5,
     )
+    top_news = top_news_future.result()
 
     # Fallback for top_news if RSS failed
     if not top_news and newsdata_articles:
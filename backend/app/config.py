@@ -18,6 +18,8 @@ class Settings(BaseSettings):
 
     # Services
     finbert_model: str = "ProsusAI/finbert"
+    # Optional dedicated endpoint (e.g. an int8-quantized FinBERT deployment)
+    finbert_endpoint: Optional[str] = None
     summarization_model: str = "sshleifer/distilbart-cnn-12-6"
     cache_ttl: int = 43200  # 12 hours
     hf_endpoint: Optional[str] = None
@@ -3,22 +3,32 @@ import threading
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from app.config import settings
 from app.database import engine, Base
 from app.api import router_stocks
 from app.models import Stock, Analysis, NewsArticle, FIIDIIActivity
 from app.utils.nifty100 import NIFTY100
 from app.services.spike_service import precompute_top_movers
+from app.services.news_service import precompute_mover_news
 
 # Create all database tables
 Base.metadata.create_all(bind=engine)
 
 
+def _prewarm_caches() -> None:
+    """Compute homepage movers, then prefetch and score their headlines."""
+    movers = precompute_top_movers(NIFTY100)
+    if movers:
+        tickers = list(movers.get("gainers", {})) + list(movers.get("losers", {}))
+        precompute_mover_news(list(dict.fromkeys(tickers)))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Pre-warm caches on startup so the first visitor gets instant results."""
     # Fire-and-forget background thread so it doesn't block the server boot
-    t = threading.Thread(target=precompute_top_movers, args=(NIFTY100,), daemon=True)
+    t = threading.Thread(target=_prewarm_caches, daemon=True)
     t.start()
     yield
 
@@ -47,6 +57,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON payloads (chart history, news lists) sent to the browser on every page view
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 
 @app.get("/health")
 def health_check():
@@ -15,6 +15,8 @@ from typing import Dict, Optional
 import numpy as np
 import pandas as pd
 
+from app.utils.stderr import suppress_stderr
+
 try:
     from xgboost import XGBClassifier
     _HAS_XGBOOST = True
@@ -97,10 +99,8 @@ def _get_sector_return(ticker: str, lookback_days: int = 5) -> float:
         if not sector_ticker:
             return 0.0
 
-        import contextlib
-        import io
         t = yf.Ticker(sector_ticker)
-        with contextlib.redirect_stderr(io.StringIO()):
+        with suppress_stderr():
             hist = t.history(period=f"{lookback_days + 5}d", interval="1d")
         if hist is None or hist.empty or len(hist) < 2:
             return 0.0
@@ -122,12 +122,10 @@ def _build_features(ticker: str, years: int = 2) -> Optional[pd.DataFrame]:
         return None
 
     try:
-        import contextlib
-        import io
 
         period = f"{years * 365 + 30}d"
         t = yf.Ticker(ticker)
-        with contextlib.redirect_stderr(io.StringIO()):
+        with suppress_stderr():
             df = t.history(period=period, interval="1d")
 
         if df is None or df.empty or len(df) < 60:
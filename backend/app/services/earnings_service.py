@@ -5,15 +5,19 @@ import yfinance as yf
 import pandas as pd
 
 
-def get_latest_earnings(ticker: str) -> Optional[Dict]:
+def get_latest_earnings(ticker: str, yf_ticker: Optional[yf.Ticker] = None) -> Optional[Dict]:
     """
     Extract latest quarterly earnings from yfinance.
     
+    Args:
+        ticker: Stock ticker symbol
+        yf_ticker: Existing yf.Ticker for this symbol to reuse, if the caller has one
+
     Returns:
         Dict with earnings data or None if not available
     """
     try:
-        t = yf.Ticker(ticker)
+        t = yf_ticker or yf.Ticker(ticker)
         qf = t.quarterly_financials
         if qf is None or qf.empty:
             return None
@@ -40,10 +44,12 @@ def check_earnings_release(ticker: str, lookback_days: int = 1) -> Tuple[bool, O
     Returns:
         (released: bool, earnings_data: Dict or None)
     """
+    # One Ticker handle for both the calendar and financials lookups (and the
+    # fallback below), so its session and fetched data are reused.
+    t = yf.Ticker(ticker)
     try:
-        t = yf.Ticker(ticker)
         cal = t.calendar
-        latest_earnings = get_latest_earnings(ticker)
+        latest_earnings = get_latest_earnings(ticker, yf_ticker=t)
         if cal is None or cal.empty:
             return False, latest_earnings
 
@@ -65,7 +71,7 @@ def check_earnings_release(ticker: str, lookback_days: int = 1) -> Tuple[bool, O
                     return True, payload
         return False, latest_earnings
     except Exception:
-        return False, get_latest_earnings(ticker)
+        return False, get_latest_earnings(ticker, yf_ticker=t)
 
 
 def calculate_beat_miss(actual: float, estimate: float) -> Tuple[str, float]:
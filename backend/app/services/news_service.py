@@ -1,6 +1,7 @@
 """Service for fetching and deduplicating stock news from RSS feeds."""
 
 import feedparser
+import requests
 import base64
 import math
 import urllib.parse
@@ -8,6 +9,8 @@ import time
 import random
 import re
 import html
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
 from typing import Dict, List, Optional
@@ -36,6 +39,159 @@ NOISE_KEYWORDS = {
 }
 
 
+# RSS fetches are network-bound, so feeds are requested concurrently on a shared pool.
+_FEED_WORKERS = 8
+_GOOGLE_QUERIES_PER_WAVE = 2
+_feed_executor = ThreadPoolExecutor(max_workers=_FEED_WORKERS, thread_name_prefix="rss")
+
+# Shared keep-alive session: feeds hit the same few hosts, so TLS handshakes are
+# amortized across requests. Pool size matches the worker count per host.
+_FEED_TIMEOUT = 5
+_session = requests.Session()
+_session.headers["User-Agent"] = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/124.0.0.0 Safari/537.36"
+)
+_adapter = requests.adapters.HTTPAdapter(pool_connections=_FEED_WORKERS, pool_maxsize=_FEED_WORKERS)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+# ── In-memory TTL cache of ranked headlines ───────────────────────────────
+_news_cache: Dict[tuple, tuple] = {}  # key -> (timestamp, ranked articles)
+_NEWS_CACHE_TTL = 15 * 60  # 15 minutes
+# Candidate pool sizes headlines are fetched at; callers get a slice of the pool,
+# so e.g. every /news limit up to 10 shares one cache entry per ticker.
+_NEWS_POOL_SIZES = (10, 25, 50)
+
+
+def _news_pool_size(max_headlines: int) -> int:
+    """Smallest standard pool that holds max_headlines (or the request itself, if larger)."""
+    target = max(0, int(max_headlines))
+    return next((size for size in _NEWS_POOL_SIZES if size >= target), target)
+
+
+def _store_news(cache_key: tuple, ranked: List[Dict]) -> None:
+    """Cache ranked headlines, dropping expired entries so the cache stays bounded."""
+    now = time.time()
+    # list() snapshot: fetch_news runs on several threads at once
+    for key in [key for key, (ts, _) in list(_news_cache.items()) if now - ts >= _NEWS_CACHE_TTL]:
+        _news_cache.pop(key, None)
+    _news_cache[cache_key] = (now, ranked)
+
+
+class _RateLimiter:
+    """Per-host adaptive rate limit: no delay until a host answers 429/503.
+
+    Each throttled response doubles that host's delay (capped); each other
+    response halves it back towards zero. While a host has a delay, every
+    request reserves the next slot on that host's schedule, so concurrent
+    requests are spaced `delay` apart instead of firing together after a
+    shared sleep. Requests always get <=100ms jitter.
+    """
+
+    THROTTLE_STATUSES = {429, 503}
+
+    def __init__(self, base_delay: float = 1.0, max_delay: float = 8.0):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._delays: Dict[str, float] = {}
+        self._next_allowed: Dict[str, float] = {}  # host -> monotonic time of its next free slot
+        self._lock = threading.Lock()
+
+    def reserve(self, host: str, now: float) -> float:
+        """Claim host's next request slot; returns seconds to wait until it."""
+        with self._lock:
+            delay = self._delays.get(host, 0.0)
+            if not delay:
+                self._next_allowed.pop(host, None)
+                return 0.0
+            slot = max(now, self._next_allowed.get(host, now))
+            self._next_allowed[host] = slot + delay
+            return slot - now
+
+    def wait(self, host: str) -> None:
+        time.sleep(self.reserve(host, time.monotonic()) + random.random() * 0.1)
+
+    def record(self, host: str, status: Optional[int]) -> None:
+        with self._lock:
+            delay = self._delays.get(host, 0.0)
+            if status in self.THROTTLE_STATUSES:
+                self._delays[host] = min(max(delay * 2, self.base_delay), self.max_delay)
+            elif delay:
+                halved = delay / 2
+                if halved < 0.1:
+                    self._delays.pop(host, None)
+                else:
+                    self._delays[host] = halved
+
+
+_rate_limiter = _RateLimiter()
+
+# Parsed feeds are shared for a short while: the generic publisher feeds are the same
+# for every ticker, so concurrent fetch_news calls (e.g. the startup mover pre-warm)
+# fetch each URL once. Concurrent requests for a URL wait on the one in flight.
+_FEED_CACHE_TTL = 60
+_feed_cache: Dict[str, tuple] = {}  # url -> (timestamp, parsed feed)
+_feed_inflight: Dict[str, Future] = {}
+_feed_cache_lock = threading.Lock()
+
+
+def _parse_feed(url: str):
+    """Fetch and parse one RSS feed, sharing recent and in-flight results. Returns None on failure."""
+    with _feed_cache_lock:
+        cached = _feed_cache.get(url)
+        if cached and time.time() - cached[0] < _FEED_CACHE_TTL:
+            return cached[1]
+        pending = _feed_inflight.get(url)
+        if pending is None:
+            pending = _feed_inflight[url] = Future()
+            owner = True
+        else:
+            owner = False
+    if not owner:
+        return pending.result()
+
+    feed = None
+    try:
+        feed = _fetch_feed(url)
+    finally:
+        with _feed_cache_lock:
+            now = time.time()
+            # Failures are not cached so the next caller retries
+            if feed is not None:
+                for key in [key for key, (ts, _) in _feed_cache.items() if now - ts >= _FEED_CACHE_TTL]:
+                    del _feed_cache[key]
+                _feed_cache[url] = (now, feed)
+            del _feed_inflight[url]
+        pending.set_result(feed)
+    return feed
+
+
+def _fetch_feed(url: str):
+    """Fetch and parse one RSS feed over the shared session. Returns None on failure."""
+    host = urllib.parse.urlparse(url).netloc
+    _rate_limiter.wait(host)
+    try:
+        resp = _session.get(url, timeout=_FEED_TIMEOUT)
+    except Exception:
+        return None
+    _rate_limiter.record(host, resp.status_code)
+    if resp.status_code != 200:
+        return None
+    try:
+        return feedparser.parse(resp.content)
+    except Exception:
+        return None
+
+
+def _parse_feeds(urls: List[str]) -> List:
+    """Fetch and parse RSS feeds concurrently, preserving input order."""
+    if not urls:
+        return []
+    return list(_feed_executor.map(_parse_feed, urls))
+
+
 def _is_noise_paragraph(text: str) -> bool:
     """Check if a paragraph is likely noise (ads, footer, nav, etc)."""
     if not text:
@@ -288,17 +444,14 @@ def _build_query_variations(
     return unique_queries
 
 
-def fetch_news(
+def _fetch_ranked_news(
     ticker: str,
-    max_headlines: int = 10,
-    lookback_days: int = 3,
-    include_full_text: bool = False,
-    max_scrapes: int = 5,
-    allow_metadata_fallback: bool = False,
-    stock_name: Optional[str] = None,
-    price_change_pct: Optional[float] = None,
+    max_headlines: int,
+    lookback_days: int,
+    stock_name: Optional[str],
+    price_change_pct: Optional[float],
 ) -> List[Dict]:
-    """Fetch and rank recent news by recency and source trust."""
+    """Internal: query the RSS feeds and rank candidates by recency and source trust."""
     query_variations = _build_query_variations(ticker, stock_name=stock_name, price_change_pct=price_change_pct)
 
     # Direct source RSS feeds — give real article URLs, no Google redirect
@@ -387,12 +540,13 @@ def fetch_news(
         })
 
     # ── Step 1: Try direct RSS feeds first (give real scrapeable URLs) ────
-    for feed_url in DIRECT_RSS_FEEDS:
+    direct_feeds = _parse_feeds(DIRECT_RSS_FEEDS) if candidate_pool_size > 0 else []
+    for feed_url, feed in zip(DIRECT_RSS_FEEDS, direct_feeds):
         if len(articles) >= candidate_pool_size:
             break
+        if feed is None:
+            continue
         try:
-            time.sleep(0.2)
-            feed = feedparser.parse(feed_url)
             source_name = urllib.parse.urlparse(feed_url).netloc.replace("www.", "").replace("feeds.", "")
             for entry in feed.entries:
                 _add_entry(entry, source_override=source_name)
@@ -400,16 +554,23 @@ def fetch_news(
             continue
 
     # ── Step 2: Google News RSS for remaining slots (headlines only) ──────
-    for query in query_variations:
+    # Queries are fetched in small concurrent waves, consumed in priority order,
+    # and later waves are skipped once the pool is full.
+    google_urls = [
+        endpoint.format(urllib.parse.quote_plus(query))
+        for query in query_variations
+        for endpoint in GOOGLE_NEWS_ENDPOINTS
+    ]
+    wave_size = _GOOGLE_QUERIES_PER_WAVE * len(GOOGLE_NEWS_ENDPOINTS)
+    for wave_start in range(0, len(google_urls), wave_size):
         if len(articles) >= candidate_pool_size:
             break
-        for endpoint in GOOGLE_NEWS_ENDPOINTS:
+        for feed in _parse_feeds(google_urls[wave_start:wave_start + wave_size]):
             if len(articles) >= candidate_pool_size:
                 break
+            if feed is None:
+                continue
             try:
-                time.sleep(0.25 + random.random() * 0.5)
-                url = endpoint.format(urllib.parse.quote_plus(query))
-                feed = feedparser.parse(url)
                 for entry in feed.entries:
                     if len(articles) >= candidate_pool_size:
                         break
@@ -454,9 +615,38 @@ def fetch_news(
                 recency_score = 0.5
         return 0.6 * recency_score + 0.4 * float(article.get("trust_score", 0.7))
 
-    ranked = sorted(articles, key=rank_score, reverse=True)
+    return sorted(articles, key=rank_score, reverse=True)
+
+
+def fetch_news(
+    ticker: str,
+    max_headlines: int = 10,
+    lookback_days: int = 3,
+    include_full_text: bool = False,
+    max_scrapes: int = 5,
+    allow_metadata_fallback: bool = False,
+    stock_name: Optional[str] = None,
+    price_change_pct: Optional[float] = None,
+) -> List[Dict]:
+    """
+    Fetch and rank recent news by recency and source trust.
+    Ranked headlines are cached in-memory for 15 minutes; callers get copies
+    of the article dicts so they can annotate them freely.
+    """
+    pool_size = _news_pool_size(max_headlines)
+    cache_key = (ticker, pool_size, lookback_days, stock_name, price_change_pct)
+    cached = _news_cache.get(cache_key)
+    if cached and time.time() - cached[0] < _NEWS_CACHE_TTL:
+        ranked = cached[1]
+    else:
+        ranked = _fetch_ranked_news(ticker, pool_size, lookback_days, stock_name, price_change_pct)
+        # Empty results are not cached so a transient feed outage is retried
+        if ranked:
+            _store_news(cache_key, ranked)
+
+    target_count = max(0, int(max_headlines))
     if not include_full_text:
-        return ranked[:max_headlines]
+        return [dict(article) for article in ranked[:max_headlines]]
 
     # ── include_full_text path: enrich with metadata fallback ─────────────
     # Scraping has been removed; use title + description as full_text.
@@ -488,4 +678,33 @@ def fetch_news(
         if len(selected) >= target_count:
             break
 
-    return selected[:target_count]
\ No newline at end of file
+    return selected[:target_count]
+
+
+def precompute_mover_news(tickers: List[str], lookback_days: int = 3, max_headlines: int = 10) -> None:
+    """
+    Pre-warm the news and sentiment caches for the homepage movers.
+
+    Fetches every ticker's headlines concurrently with the same arguments the
+    analysis endpoint uses, then scores all titles through the batched FinBERT
+    scorer, so opening a mover's page hits warm caches.
+    """
+    if not tickers:
+        return
+    print(f"[news_service] Pre-fetching news for {len(tickers)} movers...")
+    try:
+        from app.services.sentiment_service import get_sentiment_analyzer
+
+        # Separate pool: fetch_news itself waits on _feed_executor
+        with ThreadPoolExecutor(max_workers=len(tickers), thread_name_prefix="mover-news") as executor:
+            results = list(executor.map(
+                lambda t: fetch_news(t, max_headlines=max_headlines, lookback_days=lookback_days),
+                tickers,
+            ))
+
+        titles = [article.get("title", "") for articles in results for article in articles]
+        # The analyzer logs how many of these fell back to keyword scoring
+        get_sentiment_analyzer().analyse_sentiment_batch(titles)
+        print(f"[news_service] Pre-fetch done: {len(titles)} headlines scored.")
+    except Exception as e:
+        print(f"[news_service] Pre-fetch failed: {e}")
@@ -9,6 +9,8 @@ from typing import Dict, List, Optional
 
 import pandas as pd
 
+from app.utils.stderr import suppress_stderr
+
 try:
     from sklearn.cluster import KMeans
     _HAS_SKLEARN = True
@@ -27,6 +29,7 @@ except ImportError:
 # ── Module-level cache ────────────────────────────────────────────────────
 _cluster_cache: Dict = {
     "mapping": None,       # Dict[str, int] — ticker → cluster_id
+    "members": None,       # Dict[int, List[str]] — cluster_id → sorted tickers
     "expires_at": 0.0,
 }
 _CACHE_TTL = 24 * 60 * 60  # 24 hours
@@ -60,13 +63,11 @@ def build_cluster_model(
         tickers = NIFTY100
 
     try:
-        import contextlib
-        import io
         from sklearn.decomposition import PCA
 
         period = f"{lookback_days + 30}d"  # extra buffer for weekends/holidays
 
-        with contextlib.redirect_stderr(io.StringIO()):
+        with suppress_stderr():
             data = yf.download(
                 tickers,
                 period=period,
@@ -115,8 +116,14 @@ def build_cluster_model(
             for ticker, label, coord in zip(corr_matrix.index, labels, coords)
         }
 
+        # Index members by cluster once so peer lookups don't rescan the mapping
+        members: Dict[int, List[str]] = {}
+        for ticker, info in mapping.items():
+            members.setdefault(info["cluster"], []).append(ticker)
+
         # Cache the result
         _cluster_cache["mapping"] = mapping
+        _cluster_cache["members"] = {cluster_id: sorted(peers) for cluster_id, peers in members.items()}
         _cluster_cache["expires_at"] = time.time() + _CACHE_TTL
 
         print(f"[sector_clustering] Built {n_clusters} clusters with PCA for {len(mapping)} tickers")
@@ -144,9 +151,8 @@ def get_stock_cluster(ticker: str) -> List[str]:
     if cluster_data is None:
         return []
 
-    cluster_id = cluster_data["cluster"]
-    peers = [t for t, data in mapping.items() if data["cluster"] == cluster_id and t != ticker]
-    return sorted(peers)
+    members = _cluster_cache["members"] or {}
+    return [t for t in members.get(cluster_data["cluster"], []) if t != ticker]
 
 
 def get_full_cluster_mapping() -> Dict[str, int]:
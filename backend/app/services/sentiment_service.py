@@ -1,13 +1,17 @@
 """Service for sentiment analysis using FinBERT via Hugging Face Inference API."""
 import os
+import threading
 import requests
+from collections import OrderedDict
 from typing import Dict, List, Optional
+from app.config import settings
 
 # Remove torch and transformers dependencies
 _HAS_FINBERT = False
 
-MODEL_NAME = "ProsusAI/finbert"
-API_URL = f"https://api-inference.huggingface.co/models/{MODEL_NAME}"
+MODEL_NAME = settings.finbert_model
+# A dedicated endpoint lets deployments serve a quantized FinBERT instead of the shared fp32 one
+API_URL = settings.finbert_endpoint or f"https://api-inference.huggingface.co/models/{MODEL_NAME}"
 
 _label_map = {
     0: "positive",
@@ -15,6 +19,32 @@ _label_map = {
     2: "neutral",
 }
 
+# ── Bounded LRU cache of API scores keyed by headline text ────────────────────
+_sentiment_cache: "OrderedDict[str, Dict]" = OrderedDict()
+_SENTIMENT_CACHE_MAX = 10_000
+_sentiment_cache_lock = threading.Lock()
+
+# Texts per inference request: keeps each call well inside its timeout on CPU-backed endpoints
+_API_BATCH_SIZE = 32
+
+
+def _cache_lookup(text: str) -> Optional[Dict]:
+    with _sentiment_cache_lock:
+        cached = _sentiment_cache.get(text)
+        if cached is None:
+            return None
+        _sentiment_cache.move_to_end(text)
+        return dict(cached)
+
+
+def _cache_store(text: str, sentiment: Dict) -> None:
+    with _sentiment_cache_lock:
+        _sentiment_cache[text] = sentiment
+        _sentiment_cache.move_to_end(text)
+        while len(_sentiment_cache) > _SENTIMENT_CACHE_MAX:
+            _sentiment_cache.popitem(last=False)
+
+
 class SentimentAnalyzer:
     """FinBERT-based sentiment analyzer using HF Inference API."""
     
@@ -22,6 +52,9 @@ class SentimentAnalyzer:
         self.api_token = os.environ.get("HF_API_TOKEN")
         self.headers = {"Authorization": f"Bearer {self.api_token}"} if self.api_token else {}
         self.using_api = bool(self.api_token)
+        # Keep-alive session so repeat inference calls skip the TCP/TLS handshake
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
 
     def _fallback_sentiment(self, text: str) -> Dict:
         lower = (text or "").lower()
@@ -36,46 +69,73 @@ class SentimentAnalyzer:
             return {"label": "negative", "label_prob": 0.7, "probs_list": [0.15, 0.7, 0.15], "sentiment_score": -0.55}
         return {"label": "neutral", "label_prob": 0.8, "probs_list": [0.1, 0.1, 0.8], "sentiment_score": 0.0}
     
+    def _scores_to_sentiment(self, scores: List[Dict]) -> Dict:
+        """Convert one HF label/score list into our sentiment format."""
+        probs = {"positive": 0.0, "negative": 0.0, "neutral": 0.0}
+        for item in scores:
+            probs[item["label"]] = item["score"]
+
+        # Sort to find the highest
+        best_label = max(probs, key=probs.get)
+        label_prob = probs[best_label]
+        sentiment_score = probs["positive"] - probs["negative"]
+
+        return {
+            "label": best_label,
+            "label_prob": label_prob,
+            "probs_list": [probs["positive"], probs["negative"], probs["neutral"]],
+            "sentiment_score": sentiment_score,
+        }
+
     def analyse_sentiment(self, text: str) -> Dict:
         """Analyze sentiment of financial text via HF API."""
-        if not text:
-            return {"label": "neutral", "label_prob": 1.0, "probs_list": [0.0, 0.0, 1.0], "sentiment_score": 0.0}
-
-        if not self.using_api:
-            return self._fallback_sentiment(text)
-
-        try:
-            # We query the HF inference API
-            response = requests.post(API_URL, headers=self.headers, json={"inputs": text, "wait_for_model": True}, timeout=10)
-            if response.status_code == 200:
-                result = response.json()
-                # The API returns a list of lists, like [[{'label': 'positive', 'score': 0.8}, ...]]
-                if result and isinstance(result, list) and len(result) > 0:
-                    scores = result[0]
-                    # Convert to our format
-                    probs = {"positive": 0.0, "negative": 0.0, "neutral": 0.0}
-                    for item in scores:
-                        probs[item["label"]] = item["score"]
-                    
-                    # Sort to find the highest
-                    best_label = max(probs, key=probs.get)
-                    label_prob = probs[best_label]
-                    sentiment_score = probs["positive"] - probs["negative"]
-                    
-                    return {
-                        "label": best_label,
-                        "label_prob": label_prob,
-                        "probs_list": [probs["positive"], probs["negative"], probs["neutral"]],
-                        "sentiment_score": sentiment_score,
-                    }
-        except Exception:
-            pass
-            
-        return self._fallback_sentiment(text)
+        return self.analyse_sentiment_batch([text])[0]
+
+    def analyse_sentiment_batch(self, texts: List[str]) -> List[Dict]:
+        """Analyze sentiment of many texts in batched HF API requests.
+
+        Empty texts are scored neutral and previously scored headlines are
+        served from the cache, so only unseen texts are sent, up to
+        _API_BATCH_SIZE per request. If the API is unavailable or a request
+        fails, the texts it carried get the keyword fallback.
+        """
+        results: List[Optional[Dict]] = [None] * len(texts)
+        pending: List[int] = []
+        for idx, text in enumerate(texts):
+            if not text:
+                results[idx] = {"label": "neutral", "label_prob": 1.0, "probs_list": [0.0, 0.0, 1.0], "sentiment_score": 0.0}
+            elif self.using_api:
+                results[idx] = _cache_lookup(text)
+                if results[idx] is None:
+                    pending.append(idx)
+
+        for start in range(0, len(pending), _API_BATCH_SIZE):
+            chunk = pending[start:start + _API_BATCH_SIZE]
+            try:
+                # One request per chunk; the API returns one score list per input
+                inputs = [texts[idx] for idx in chunk]
+                response = self.session.post(API_URL, json={"inputs": inputs, "wait_for_model": True}, timeout=10)
+                if response.status_code == 200:
+                    result = response.json()
+                    if isinstance(result, list) and len(result) == len(chunk):
+                        for idx, scores in zip(chunk, result):
+                            results[idx] = self._scores_to_sentiment(scores)
+                            _cache_store(texts[idx], dict(results[idx]))
+            except Exception:
+                pass
+
+        fallbacks = sum(1 for idx in pending if results[idx] is None)
+        if fallbacks:
+            print(f"[sentiment_service] {len(pending) - fallbacks} of {len(pending)} texts scored by FinBERT, {fallbacks} fell back to keywords")
+
+        return [
+            result if result is not None else self._fallback_sentiment(text)
+            for text, result in zip(texts, results)
+        ]
     
     def batch_score(self, texts: List[str]) -> List[Dict]:
         """Score multiple texts efficiently."""
-        return [self.analyse_sentiment(text) for text in texts]
+        return self.analyse_sentiment_batch(texts)
 
 
 _analyzer_instance: Optional[SentimentAnalyzer] = None
@@ -1,38 +1,149 @@
 """Service for detecting top movers and price spikes."""
-import contextlib
-import io
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 # pyrefly: ignore [missing-import]
 import yfinance as yf
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Tuple
 
+from app.utils.stderr import suppress_stderr
+
 
 # ── In-memory TTL cache for top movers ────────────────────────────────────────
 _top_movers_cache: Dict[str, tuple] = {}  # key -> (timestamp, result)
 _TOP_MOVERS_TTL = 300  # 5 minutes
 
+# Movement of the latest multi-ticker download per lookback, used to answer
+# single-ticker lookups without another Yahoo round-trip.
+_universe_movement: Dict[int, Tuple[float, Dict[str, float]]] = {}  # days -> (timestamp, movement)
+
+# Large universes are downloaded in concurrent ticker batches (Yahoo calls are latency-bound)
+_DOWNLOAD_BATCH_SIZE = 20
+_DOWNLOAD_WORKERS = 8
+
+# Latest multi-ticker OHLCV frame, sliced by get_recent_data instead of refetching per ticker
+_bulk_prices_cache: Dict = {
+    "data": None,          # pd.DataFrame with (Price, Ticker) MultiIndex columns
+    "fetched_at": 0.0,
+}
+
+# Yahoo's named "Nd" ranges count trading sessions, so they map to the last N bulk rows.
+# Custom ranges like "7d" are left to Ticker.history.
+_SESSION_PERIODS = {"1d": 1, "5d": 5}
+
+
+def _movements_from_close_frame(close: pd.DataFrame, days: int) -> pd.Series:
+    """
+    Percentage move per column from the close `days` sessions back to the latest close.
+
+    Vectorized over all tickers at once. Each column's NaNs are skipped, so the
+    window counts only that ticker's trading rows; columns with fewer rows use
+    their first close, single-row columns give 0.0, and empty or zero-start
+    columns are dropped.
+    """
+    values = close.to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+    counts = valid.sum(axis=0)
+    # 1 for each column's latest valid row, 2 for the one before it, ...
+    rank_from_end = np.cumsum(valid[::-1], axis=0)[::-1]
+    start_rank = np.minimum(days + 1, counts)
+
+    cols = np.arange(values.shape[1])
+    end = values[np.argmax(valid & (rank_from_end == 1), axis=0), cols]
+    start = values[np.argmax(valid & (rank_from_end == start_rank), axis=0), cols]
 
-def _movement_from_close_series(close_series: pd.Series, days: int) -> Optional[float]:
-    series = close_series.dropna()
-    if series.empty:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = (end - start) / start * 100.0
+    pct[(counts == 0) | (start == 0)] = np.nan
+    pct[counts == 1] = 0.0
+    return pd.Series(pct, index=close.columns).dropna()
+
+
+def _download_prices(tickers: List[str], period: str) -> pd.DataFrame:
+    """Download daily OHLCV for tickers, splitting large lists into concurrent batches."""
+    def _download(batch: List[str]) -> pd.DataFrame:
+        # Keep the exchange timezone so slices match Ticker.history output
+        return yf.download(batch, period=period, interval="1d", group_by="column", threads=True, ignore_tz=False, progress=False)
+
+    if len(tickers) <= _DOWNLOAD_BATCH_SIZE:
+        return _download(tickers)
+
+    batches = [tickers[i:i + _DOWNLOAD_BATCH_SIZE] for i in range(0, len(tickers), _DOWNLOAD_BATCH_SIZE)]
+    with ThreadPoolExecutor(max_workers=_DOWNLOAD_WORKERS) as executor:
+        frames = [frame for frame in executor.map(_download, batches) if frame is not None and not frame.empty]
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, axis=1)
+
+
+def _store_bulk_prices(data: pd.DataFrame) -> None:
+    """Keep the widest recent multi-ticker download for per-ticker slicing."""
+    if not isinstance(data.columns, pd.MultiIndex) or "Close" not in data:
+        return
+    current = _bulk_prices_cache["data"]
+    fresh = time.time() - _bulk_prices_cache["fetched_at"] < _DATA_CACHE_TTL
+    if fresh and current is not None and current["Close"].shape[1] > data["Close"].shape[1]:
+        return
+    _bulk_prices_cache["data"] = data
+    _bulk_prices_cache["fetched_at"] = time.time()
+
+
+def _slice_bulk_prices(ticker: str, period: str, interval: str) -> Optional[pd.DataFrame]:
+    """Return the last N daily sessions for ticker from the bulk frame, if it covers them."""
+    rows = _SESSION_PERIODS.get(period)
+    data = _bulk_prices_cache["data"]
+    if interval != "1d" or rows is None or data is None:
+        return None
+    if time.time() - _bulk_prices_cache["fetched_at"] >= _DATA_CACHE_TTL:
         return None
-    if len(series) == 1:
-        return 0.0
+    try:
+        df = data.xs(ticker, axis=1, level=1).dropna(subset=["Close"])
+    except KeyError:
+        return None
+
+    # Need more rows than requested, otherwise the bulk period may have cut the window short
+    if len(df) <= rows:
+        return None
+    return df.tail(rows).copy()
+
+
+def _movers_cache_key(tickers: List[str], days: int, top_n: int) -> str:
+    return f"movers_{','.join(sorted(tickers))}_{days}_{top_n}"
+
+
+def _rank_movement(movement: pd.Series, top_n: int) -> Dict:
+    """Shape a movement Series into the gainers/losers/movement result."""
+    movement = movement.sort_values(ascending=False)
+
+    gainers = movement.head(top_n).round(2)
+    losers = movement.tail(top_n).sort_values(ascending=True).round(2)
 
-    window = days + 1
-    start = float(series.iloc[-window]) if len(series) >= window else float(series.iloc[0])
-    end = float(series.iloc[-1])
-    if start == 0:
+    return {
+        "gainers": gainers.to_dict(),
+        "losers": losers.to_dict(),
+        "movement": movement.round(2).to_dict(),
+    }
+
+
+def _movers_from_universe(tickers: List[str], days: int, top_n: int) -> Optional[Dict]:
+    """Answer from the cached universe movement if it covers every requested ticker."""
+    cached = _universe_movement.get(days)
+    if not cached or time.time() - cached[0] >= _TOP_MOVERS_TTL:
+        return None
+    movement = cached[1]
+    if not tickers or any(ticker not in movement for ticker in tickers):
         return None
-    return ((end - start) / start) * 100.0
+    return _rank_movement(pd.Series({ticker: movement[ticker] for ticker in tickers}), top_n)
 
 
 def get_top_movers(tickers: List[str], days: int = 1, top_n: int = 5) -> Dict:
     """
     Get top gainers and losers for a list of tickers over a period.
-    Results are cached in-memory for 5 minutes to avoid hammering Yahoo Finance.
+    Results are cached in-memory for 5 minutes to avoid hammering Yahoo Finance,
+    and subsets of an already-downloaded universe (e.g. one NIFTY100 ticker)
+    are answered from its movement without a new download.
 
     Args:
         tickers: List of ticker symbols
@@ -42,12 +153,14 @@ def get_top_movers(tickers: List[str], days: int = 1, top_n: int = 5) -> Dict:
     Returns:
         Dict with gainers, losers, and full movement data
     """
-    cache_key = f"movers_{len(tickers)}_{days}_{top_n}"
+    cache_key = _movers_cache_key(tickers, days, top_n)
     cached = _top_movers_cache.get(cache_key)
     if cached and time.time() - cached[0] < _TOP_MOVERS_TTL:
         return cached[1]
 
-    result = _fetch_top_movers(tickers, days, top_n)
+    result = _movers_from_universe(tickers, days, top_n)
+    if result is None:
+        result = _fetch_top_movers(tickers, days, top_n)
     _top_movers_cache[cache_key] = (time.time(), result)
     return result
 
@@ -58,55 +171,47 @@ def _fetch_top_movers(tickers: List[str], days: int = 1, top_n: int = 5) -> Dict
         period = f"{max(days + 7, 10)}d"
 
         # yfinance prints failed symbols to stderr; keep API logs clean.
-        with contextlib.redirect_stderr(io.StringIO()):
-            data = yf.download(tickers, period=period, interval="1d", group_by="column", progress=False)
+        with suppress_stderr():
+            data = _download_prices(tickers, period)
 
         if data.empty or "Close" not in data:
             return {"gainers": [], "losers": [], "movement": {}, "error": "No data found."}
 
-        close_data = data["Close"]
-        movement_map: Dict[str, float] = {}
+        if len(tickers) > 1:
+            _store_bulk_prices(data)
 
+        close_data = data["Close"]
         if isinstance(close_data, pd.Series):
-            if tickers:
-                mv = _movement_from_close_series(close_data, days)
-                if mv is not None:
-                    movement_map[tickers[0]] = round(mv, 2)
-        else:
-            for ticker in close_data.columns:
-                mv = _movement_from_close_series(close_data[ticker], days)
-                if mv is not None:
-                    movement_map[ticker] = round(mv, 2)
-
-        if not movement_map:
-            return {"gainers": [], "losers": [], "movement": {}, "error": "No valid ticker movement found."}
+            if not tickers:
+                return {"gainers": [], "losers": [], "movement": {}, "error": "No valid ticker movement found."}
+            close_data = close_data.to_frame(tickers[0])
 
-        movement = pd.Series(movement_map).sort_values(ascending=False)
+        movement = _movements_from_close_frame(close_data, days).round(2)
+        if movement.empty:
+            return {"gainers": [], "losers": [], "movement": {}, "error": "No valid ticker movement found."}
 
-        gainers = movement.head(top_n).round(2)
-        losers = movement.tail(top_n).sort_values(ascending=True).round(2)
+        if len(tickers) > 1:
+            _universe_movement[days] = (time.time(), movement.to_dict())
 
-        return {
-            "gainers": gainers.to_dict(),
-            "losers": losers.to_dict(),
-            "movement": movement.round(2).to_dict(),
-        }
+        return _rank_movement(movement, top_n)
     except Exception as exc:
         return {"gainers": [], "losers": [], "movement": {}, "error": str(exc)}
 
 
-def precompute_top_movers(tickers: List[str]) -> None:
+def precompute_top_movers(tickers: List[str]) -> Optional[Dict]:
     """Pre-warm the top movers cache. Called once on app startup in a background thread."""
     print("[spike_service] Pre-computing top movers for homepage...")
     try:
         result = _fetch_top_movers(tickers, days=1, top_n=5)
-        cache_key = f"movers_{len(tickers)}_1_5"
+        cache_key = _movers_cache_key(tickers, 1, 5)
         _top_movers_cache[cache_key] = (time.time(), result)
         g_count = len(result.get('gainers', {}))
         l_count = len(result.get('losers', {}))
         print(f"[spike_service] Pre-compute done: {g_count} gainers, {l_count} losers cached.")
+        return result
     except Exception as e:
         print(f"[spike_service] Pre-compute failed: {e}")
+        return None
 
 
 _data_cache: Dict[str, Tuple[float, Optional[pd.DataFrame]]] = {}
@@ -131,15 +236,21 @@ def get_recent_data(ticker: str, period: str = "7d", interval: str = "1d") -> Op
         df = cached[1]
         return df.copy() if df is not None else None
 
+    bulk_df = _slice_bulk_prices(ticker, period, interval)
+    if bulk_df is not None:
+        bulk_df["PctChange"] = bulk_df["Close"].pct_change() * 100
+        _data_cache[cache_key] = (time.time(), bulk_df)
+        return bulk_df.copy()
+
     with _yf_lock:
         try:
             t = yf.Ticker(ticker)
-            with contextlib.redirect_stderr(io.StringIO()):
+            with suppress_stderr():
                 df = t.history(period=period, interval=interval)
             
             # Fallback for yfinance bug where 1d returns empty for Indian stocks
             if df.empty and period == "1d" and interval == "5m":
-                with contextlib.redirect_stderr(io.StringIO()):
+                with suppress_stderr():
                     df = t.history(period="5d", interval="5m")
 
             if df.empty:
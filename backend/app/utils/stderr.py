@@ -0,0 +1,37 @@
+# utils/stderr.py
+
+# -----------------------------------------
+# Thread-safe stderr suppression
+# -----------------------------------------
+
+import contextlib
+import io
+import sys
+import threading
+
+# contextlib.redirect_stderr swaps the process-wide sys.stderr, so two threads
+# redirecting at once can restore each other's stream in the wrong order and
+# leave stderr pointing at a dead buffer. Share one redirect instead: the first
+# thread in swaps it out, the last one out puts the real stream back.
+_lock = threading.Lock()
+_depth = 0
+_saved_stderr = None
+
+
+@contextlib.contextmanager
+def suppress_stderr():
+    """Silence stderr (e.g. yfinance's failed-symbol messages) for the block."""
+    global _depth, _saved_stderr
+    with _lock:
+        if _depth == 0:
+            _saved_stderr = sys.stderr
+            sys.stderr = io.StringIO()
+        _depth += 1
+    try:
+        yield
+    finally:
+        with _lock:
+            _depth -= 1
+            if _depth == 0:
+                sys.stderr = _saved_stderr
+                _saved_stderr = None
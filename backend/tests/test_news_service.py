@@ -19,4 +19,69 @@ def test_extract_article_paragraphs_from_article_url():
         print(f"{index}. {paragraph}")
 
     assert isinstance(paragraphs, list)
-    assert len(paragraphs) > 0, "No paragraphs were extracted"
\ No newline at end of file
+    assert len(paragraphs) > 0, "No paragraphs were extracted"
+
+
+def test_news_limits_share_a_pool_and_expired_entries_are_dropped(monkeypatch):
+    calls = []
+
+    def fake_ranked(ticker, max_headlines, lookback_days, stock_name, price_change_pct):
+        calls.append(max_headlines)
+        return [{"title": f"{ticker} headline {i}"} for i in range(max_headlines)]
+
+    stale_key = ("OLD.NS", 10, 3, None, None)
+    monkeypatch.setattr(MODULE, "_news_cache", {stale_key: (0.0, [{"title": "old"}])})
+    monkeypatch.setattr(MODULE, "_fetch_ranked_news", fake_ranked)
+
+    three = MODULE.fetch_news("A.NS", max_headlines=3)
+    ten = MODULE.fetch_news("A.NS", max_headlines=10)
+    thirty = MODULE.fetch_news("A.NS", max_headlines=30)
+
+    assert calls == [10, 50]
+    assert [len(three), len(ten), len(thirty)] == [3, 10, 30]
+    assert stale_key not in MODULE._news_cache
+
+
+def test_concurrent_requests_for_one_feed_share_a_single_fetch(monkeypatch):
+    calls = []
+
+    def fake_fetch(url):
+        calls.append(url)
+        MODULE.time.sleep(0.05)
+        return {"url": url}
+
+    monkeypatch.setattr(MODULE, "_feed_cache", {})
+    monkeypatch.setattr(MODULE, "_fetch_feed", fake_fetch)
+    shared = "https://www.financialexpress.com/feed/"
+    per_ticker = "https://feeds.finance.yahoo.com/rss/2.0/headline?s=A.NS"
+
+    feeds = MODULE._parse_feeds([shared] * 5 + [per_ticker])
+    again = MODULE._parse_feed(shared)
+
+    assert sorted(calls) == sorted([shared, per_ticker])
+    assert all(feed is feeds[0] for feed in feeds[:5]) and again is feeds[0]
+
+
+def test_rate_limiter_backs_off_on_throttling_and_recovers():
+    limiter = MODULE._RateLimiter(base_delay=1.0, max_delay=4.0)
+
+    for _ in range(4):
+        limiter.record("news.google.com", 429)
+    assert limiter._delays["news.google.com"] == 4.0
+
+    limiter.record("news.google.com", 200)
+    assert limiter._delays["news.google.com"] == 2.0
+    for _ in range(5):
+        limiter.record("news.google.com", 200)
+    assert "news.google.com" not in limiter._delays
+
+
+def test_rate_limiter_spaces_concurrent_requests_to_a_throttled_host():
+    limiter = MODULE._RateLimiter(base_delay=1.0)
+    assert limiter.reserve("news.google.com", now=100.0) == 0.0
+
+    limiter.record("news.google.com", 429)
+    waits = [limiter.reserve("news.google.com", now=100.0) for _ in range(4)]
+
+    assert waits == [0.0, 1.0, 2.0, 3.0]
+    assert limiter.reserve("other.example.com", now=100.0) == 0.0
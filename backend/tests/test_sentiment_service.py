@@ -0,0 +1,103 @@
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+
+SERVICE_FILE = Path(__file__).resolve().parents[1] / "app" / "services" / "sentiment_service.py"
+SPEC = spec_from_file_location("sentiment_service", SERVICE_FILE)
+MODULE = module_from_spec(SPEC)
+assert SPEC and SPEC.loader is not None
+SPEC.loader.exec_module(MODULE)
+
+SentimentAnalyzer = MODULE.SentimentAnalyzer
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+def test_batch_fallback_when_api_unavailable():
+    analyzer = SentimentAnalyzer()
+    analyzer.using_api = False
+
+    results = analyzer.analyse_sentiment_batch(["Profit surge after strong quarter", "", "Shares slump on weak outlook"])
+
+    assert [r["label"] for r in results] == ["positive", "neutral", "negative"]
+    assert results[1]["label_prob"] == 1.0
+
+
+def test_batch_sends_all_texts_in_one_request(monkeypatch):
+    calls = []
+
+    def fake_post(url, json, timeout):
+        calls.append(json["inputs"])
+        return FakeResponse([
+            [{"label": "positive", "score": 0.9}, {"label": "negative", "score": 0.05}, {"label": "neutral", "score": 0.05}],
+            [{"label": "positive", "score": 0.1}, {"label": "negative", "score": 0.8}, {"label": "neutral", "score": 0.1}],
+        ])
+
+    monkeypatch.setattr(MODULE, "_sentiment_cache", MODULE.OrderedDict())
+    analyzer = SentimentAnalyzer()
+    analyzer.using_api = True
+    monkeypatch.setattr(analyzer.session, "post", fake_post)
+
+    results = analyzer.analyse_sentiment_batch(["Headline A", "", "Headline B"])
+
+    assert calls == [["Headline A", "Headline B"]]
+    assert [r["label"] for r in results] == ["positive", "neutral", "negative"]
+    assert round(results[0]["sentiment_score"], 2) == 0.85
+    assert round(results[2]["sentiment_score"], 2) == -0.7
+
+
+def test_batch_serves_repeat_headlines_from_cache(monkeypatch):
+    calls = []
+
+    def fake_post(url, json, timeout):
+        calls.append(json["inputs"])
+        return FakeResponse([
+            [{"label": "positive", "score": 0.6}, {"label": "negative", "score": 0.3}, {"label": "neutral", "score": 0.1}]
+            for _ in json["inputs"]
+        ])
+
+    monkeypatch.setattr(MODULE, "_sentiment_cache", MODULE.OrderedDict())
+    analyzer = SentimentAnalyzer()
+    analyzer.using_api = True
+    monkeypatch.setattr(analyzer.session, "post", fake_post)
+
+    first = analyzer.analyse_sentiment_batch(["Cached headline"])
+    second = analyzer.analyse_sentiment_batch(["Cached headline", "Fresh headline"])
+
+    assert calls == [["Cached headline"], ["Fresh headline"]]
+    assert second[0] == first[0]
+
+
+def test_batch_splits_large_inputs_into_fixed_size_requests(monkeypatch):
+    calls = []
+
+    def fake_post(url, json, timeout):
+        calls.append(len(json["inputs"]))
+        if len(calls) == 2:
+            raise TimeoutError("slow chunk")
+        return FakeResponse([
+            [{"label": "positive", "score": 0.9}, {"label": "negative", "score": 0.05}, {"label": "neutral", "score": 0.05}]
+            for _ in json["inputs"]
+        ])
+
+    monkeypatch.setattr(MODULE, "_sentiment_cache", MODULE.OrderedDict())
+    monkeypatch.setattr(MODULE, "_API_BATCH_SIZE", 4)
+    analyzer = SentimentAnalyzer()
+    analyzer.using_api = True
+    monkeypatch.setattr(analyzer.session, "post", fake_post)
+    texts = [f"Headline {i}" for i in range(10)]
+
+    results = analyzer.analyse_sentiment_batch(texts)
+
+    assert calls == [4, 4, 2]
+    # The failed middle chunk gets the keyword fallback (neutral for these texts)
+    assert [r["label"] for r in results] == ["positive"] * 4 + ["neutral"] * 4 + ["positive"] * 2
+    assert list(MODULE._sentiment_cache) == texts[:4] + texts[8:]
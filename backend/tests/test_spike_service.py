@@ -0,0 +1,91 @@
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+SERVICE_FILE = Path(__file__).resolve().parents[1] / "app" / "services" / "spike_service.py"
+SPEC = spec_from_file_location("spike_service", SERVICE_FILE)
+MODULE = module_from_spec(SPEC)
+assert SPEC and SPEC.loader is not None
+SPEC.loader.exec_module(MODULE)
+
+
+def test_movements_skip_each_tickers_missing_rows():
+    close = pd.DataFrame(
+        {
+            "FULL.NS": [100.0, 110.0, 121.0],
+            "GAPPY.NS": [50.0, np.nan, 55.0],
+            "SHORT.NS": [np.nan, np.nan, 80.0],
+            "EMPTY.NS": [np.nan, np.nan, np.nan],
+            "ZERO.NS": [0.0, 0.0, 5.0],
+        }
+    )
+
+    movement = MODULE._movements_from_close_frame(close, days=1)
+
+    assert round(movement["FULL.NS"], 2) == 10.0
+    assert round(movement["GAPPY.NS"], 2) == 10.0
+    assert movement["SHORT.NS"] == 0.0
+    assert "EMPTY.NS" not in movement
+    assert "ZERO.NS" not in movement
+
+
+def test_movements_fall_back_to_first_close_when_window_exceeds_history():
+    close = pd.DataFrame({"A.NS": [200.0, 220.0, 180.0]})
+
+    movement = MODULE._movements_from_close_frame(close, days=10)
+
+    assert round(movement["A.NS"], 2) == -10.0
+
+
+def test_bulk_slice_takes_last_sessions_for_yahoo_ranges(monkeypatch):
+    # Business days only: on a Monday "5d" must still return five sessions, not a calendar week
+    index = pd.bdate_range(end=pd.Timestamp("2026-10-12", tz="Asia/Kolkata"), periods=8)
+    columns = pd.MultiIndex.from_product([["Close", "Volume"], ["A.NS", "B.NS"]], names=["Price", "Ticker"])
+    data = pd.DataFrame(1.0, index=index, columns=columns)
+    monkeypatch.setattr(MODULE, "_bulk_prices_cache", {"data": data, "fetched_at": MODULE.time.time()})
+
+    sliced = MODULE._slice_bulk_prices("A.NS", "5d", "1d")
+
+    assert list(sliced.index) == list(index[-5:])
+    assert MODULE._slice_bulk_prices("A.NS", "7d", "1d") is None
+
+
+def _fake_download(closes, calls):
+    def download(tickers, **kwargs):
+        calls.append(list(tickers))
+        columns = pd.MultiIndex.from_product([["Close"], tickers], names=["Price", "Ticker"])
+        return pd.DataFrame([[closes[t][0] for t in tickers], [closes[t][1] for t in tickers]], columns=columns)
+    return download
+
+
+def test_single_ticker_movers_are_cached_per_ticker(monkeypatch):
+    calls = []
+    closes = {"A.NS": (100.0, 110.0), "B.NS": (100.0, 90.0)}
+    monkeypatch.setattr(MODULE, "_top_movers_cache", {})
+    monkeypatch.setattr(MODULE, "_universe_movement", {})
+    monkeypatch.setattr(MODULE.yf, "download", _fake_download(closes, calls))
+
+    first = MODULE.get_top_movers(["A.NS"])
+    second = MODULE.get_top_movers(["B.NS"])
+
+    assert calls == [["A.NS"], ["B.NS"]]
+    assert first["movement"] == {"A.NS": 10.0}
+    assert second["movement"] == {"B.NS": -10.0}
+
+
+def test_universe_subset_skips_download_but_outsider_downloads(monkeypatch):
+    calls = []
+    closes = {"OUT.NS": (50.0, 55.0)}
+    monkeypatch.setattr(MODULE, "_top_movers_cache", {})
+    monkeypatch.setattr(MODULE, "_universe_movement", {1: (MODULE.time.time(), {"A.NS": 3.5, "B.NS": -1.25})})
+    monkeypatch.setattr(MODULE.yf, "download", _fake_download(closes, calls))
+
+    subset = MODULE.get_top_movers(["B.NS"])
+    outsider = MODULE.get_top_movers(["OUT.NS"])
+
+    assert subset["movement"] == {"B.NS": -1.25}
+    assert calls == [["OUT.NS"]]
+    assert outsider["movement"] == {"OUT.NS": 10.0}